@@ -7,56 +7,39 @@ from ocp_resources.namespace import Namespace
 from ocp_resources.notebook import Notebook
 from ocp_resources.persistent_volume_claim import PersistentVolumeClaim
 
+from tests.workbenches.utils import wait_for_pod_ready
 
+
+@pytest.mark.parametrize(
+    "unprivileged_model_namespace",
+    [
+        pytest.param(
+            {
+                "name": "test-odh-notebook",
+                "add-dashboard-label": True,
+            },
+        )
+    ],
+    indirect=True,
+)
 class TestNotebook:
     @pytest.mark.smoke
     @pytest.mark.parametrize(
-        "unprivileged_model_namespace,users_persistent_volume_claim,default_notebook",
+        "users_persistent_volume_claim,default_notebook,expected_auth_resources",
         [
             pytest.param(
-                {
-                    "name": "test-odh-notebook",
-                    "add-dashboard-label": True,
-                },
                 {"name": "test-odh-notebook"},
                 {
                     "namespace": "test-odh-notebook",
                     "name": "test-odh-notebook",
                 },
-            )
-        ],
-        indirect=True,
-    )
-    def test_create_simple_notebook(
-        self,
-        unprivileged_client: DynamicClient,
-        unprivileged_model_namespace: Namespace,
-        users_persistent_volume_claim: PersistentVolumeClaim,
-        default_notebook: Notebook,
-    ):
-        """
-        Create a simple Notebook CR with all necessary resources and see if the Notebook Operator creates it properly
-        """
-        notebook_pod = Pod(
-            client=unprivileged_client,
-            namespace=default_notebook.namespace,
-            name=f"{default_notebook.name}-0",
-        )
-        notebook_pod.wait()
-        notebook_pod.wait_for_condition(condition=Pod.Condition.READY, status=Pod.Condition.Status.TRUE)
-
-    @pytest.mark.smoke
-    @pytest.mark.parametrize(
-        "unprivileged_model_namespace,users_persistent_volume_claim,default_notebook",
-        [
+                None,
+                id="simple-notebook",
+            ),
             pytest.param(
-                {
-                    "name": "test-auth-notebook",
-                    "add-dashboard-label": True,
-                },
                 {"name": "test-auth-notebook"},
                 {
-                    "namespace": "test-auth-notebook",
+                    "namespace": "test-odh-notebook",
                     "name": "test-auth-notebook",
                     "auth_annotations": {
                         "notebooks.opendatahub.io/auth-sidecar-cpu-request": "200m",
@@ -65,54 +48,47 @@ class TestNotebook:
                         "notebooks.opendatahub.io/auth-sidecar-memory-limit": "256Mi",
                     },
                 },
-            )
+                {
+                    "requests": {"cpu": "200m", "memory": "128Mi"},
+                    "limits": {"cpu": "500m", "memory": "256Mi"},
+                },
+                id="auth-container-resource-customization",
+            ),
         ],
-        indirect=True,
+        indirect=["users_persistent_volume_claim", "default_notebook"],
     )
-    def test_auth_container_resource_customization(
+    def test_create_notebook(
         self,
         unprivileged_client: DynamicClient,
         unprivileged_model_namespace: Namespace,
         users_persistent_volume_claim: PersistentVolumeClaim,
         default_notebook: Notebook,
+        expected_auth_resources: dict[str, dict[str, str]] | None,
     ):
         """
-        Test that Auth container resource requests and limits can be customized using annotations.
+        Create a Notebook CR with all necessary resources and see if the Notebook Operator creates it properly.
 
-        This test verifies that when a Notebook CR is created with custom Auth container resource
-        annotations, the spawned pod has the Auth container with the specified resource values.
+        When expected_auth_resources is given, also verify that the spawned pod has the Auth container with the
+        resource requests and limits set through the Notebook CR annotations.
         """
         notebook_pod = Pod(
             client=unprivileged_client,
             namespace=default_notebook.namespace,
             name=f"{default_notebook.name}-0",
         )
-        notebook_pod.wait()
-        notebook_pod.wait_for_condition(condition=Pod.Condition.READY, status=Pod.Condition.Status.TRUE)
+        wait_for_pod_ready(pod=notebook_pod)
 
-        # Verify Auth container has the expected resource values
-        auth_container = self._get_auth_container(pod=notebook_pod)
-        assert auth_container, "Auth proxy container not found in the pod"
+        if expected_auth_resources is not None:
+            auth_container = self._get_auth_container(pod=notebook_pod)
+            assert auth_container, "Auth proxy container not found in the pod"
 
-        # Check CPU request
-        assert auth_container.resources.requests["cpu"] == "200m", (
-            f"Expected CPU request '200m', got '{auth_container.resources.requests['cpu']}'"
-        )
-
-        # Check memory request
-        assert auth_container.resources.requests["memory"] == "128Mi", (
-            f"Expected memory request '128Mi', got '{auth_container.resources.requests['memory']}'"
-        )
-
-        # Check CPU limit
-        assert auth_container.resources.limits["cpu"] == "500m", (
-            f"Expected CPU limit '500m', got '{auth_container.resources.limits['cpu']}'"
-        )
-
-        # Check memory limit
-        assert auth_container.resources.limits["memory"] == "256Mi", (
-            f"Expected memory limit '256Mi', got '{auth_container.resources.limits['memory']}'"
-        )
+            for resource_kind, expected_values in expected_auth_resources.items():
+                actual_values = auth_container.resources[resource_kind]
+                for resource_name, expected_value in expected_values.items():
+                    assert actual_values[resource_name] == expected_value, (
+                        f"Expected {resource_name} {resource_kind} '{expected_value}', "
+                        f"got '{actual_values[resource_name]}'"
+                    )
 
     def _get_auth_container(self, pod: Pod):
         """
@@ -124,8 +100,6 @@ class TestNotebook:
         Returns:
             The Auth container if found, None otherwise
         """
-        containers = pod.instance.spec.containers
-        for container in containers:
-            if container.name == "kube-rbac-proxy":
-                return container
-        return None
+        return next(
+            (container for container in pod.instance.spec.containers if container.name == "kube-rbac-proxy"), None
+        )
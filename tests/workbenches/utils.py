@@ -1,7 +1,16 @@
+import time
+from http import HTTPStatus
+
+from kubernetes.client.rest import ApiException
 from kubernetes.dynamic import DynamicClient
+from ocp_resources.pod import Pod
 from ocp_resources.self_subject_review import SelfSubjectReview
 from ocp_resources.user import User
 from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError, TimeoutWatch
+from urllib3.exceptions import HTTPError
+
+from utilities.constants import Timeout
 
 LOGGER = get_logger(name=__name__)
 
@@ -21,3 +30,43 @@ def get_username(dyn_client: DynamicClient) -> str | None:
         username = user.get("metadata", {}).get("name", None)
 
     return username
+
+
+def wait_for_pod_ready(pod: Pod, timeout: int = Timeout.TIMEOUT_10MIN) -> None:
+    """
+    Wait for a pod to be created and to report the Ready condition, using a watch instead of polling.
+
+    Args:
+        pod: The pod to wait for
+        timeout: The maximum time in seconds to wait for the pod to become Ready
+
+    Raises:
+        TimeoutExpiredError: If the pod is not Ready within the timeout
+    """
+    LOGGER.info(f"Waiting for pod {pod.name} to be Ready")
+    timeout_watch = TimeoutWatch(timeout=timeout)
+    resource_version = ""
+    reconnect_attempt = 0
+
+    while remaining_time := int(timeout_watch.remaining_time()):
+        try:
+            for event in pod.watcher(timeout=remaining_time, resource_version=resource_version):
+                reconnect_attempt = 0
+                pod_instance = event["object"]
+                resource_version = pod_instance.metadata.resourceVersion
+                for condition in pod_instance.get("status", {}).get("conditions", []):
+                    if condition["type"] == Pod.Condition.READY and condition["status"] == Pod.Condition.Status.TRUE:
+                        LOGGER.info(f"Pod {pod.name} is Ready")
+                        return
+        except ApiException as exc:
+            if exc.status != HTTPStatus.GONE:
+                raise
+            # The last seen resourceVersion was compacted, restart the watch from the current pod state
+            resource_version = ""
+        except HTTPError as exc:
+            backoff = min(2**reconnect_attempt, Timeout.TIMEOUT_30SEC, timeout_watch.remaining_time())
+            reconnect_attempt += 1
+            LOGGER.warning(f"Watch on pod {pod.name} failed, reconnecting in {backoff:.0f} seconds: {exc}")
+            time.sleep(backoff)
+
+    raise TimeoutExpiredError(f"Pod {pod.name} did not become Ready within {timeout} seconds")